@@ -0,0 +1,77 @@
+"""
+Job card parsers
+----------------
+Turns a job board results page into job dicts.
+
+This module is kept free of I/O and fully typed so it can be compiled
+ahead of time with mypyc (`mypyc job_parsers.py`); the compiled extension
+is import-compatible and is picked up automatically by `main.py`.
+"""
+
+from functools import partial
+from typing import Dict, List, Optional, Union
+from urllib.parse import urljoin
+
+from selectolax.lexbor import LexborHTMLParser
+
+CardSelectors = Dict[str, str]
+Job = Dict[str, Optional[str]]
+
+# Card selectors per site, fixed at import time. An empty "link" means the
+# title element itself carries the href.
+LINKEDIN_SELECTORS: CardSelectors = {
+    "cards": "ul.jobs-search__results-list li",
+    "title": "h3",
+    "company": "h4",
+    "location": ".job-search-card__location",
+    "link": "a"
+}
+JOBSDB_SELECTORS: CardSelectors = {
+    "cards": "div.sx2jih0.zcydq8h",
+    "title": "a.sx2jih0.zcydq84.zcydq8h._17fduda0._17fduda7._17fduda7._17fduda7",
+    "company": "span.sx2jih0.zcydq84.zcydq8h._17fduda0._17fduda7._17fduda7._17fduda7",
+    "location": "span.sx2jih0.zcydq84.zcydq8h._17fduda0._17fduda7._17fduda7._17fduda7+span",
+    "link": ""
+}
+GLASSDOOR_SELECTORS: CardSelectors = {
+    "cards": "li.react-job-listing",
+    "title": "a.jobLink span",
+    "company": "div.jobHeader a",
+    "location": "span.pr-xxsm",
+    "link": "a.jobLink"
+}
+
+SITE_SELECTORS: Dict[str, CardSelectors] = {
+    "linkedin": LINKEDIN_SELECTORS,
+    "jobsdb": JOBSDB_SELECTORS,
+    "glassdoor": GLASSDOOR_SELECTORS,
+}
+
+def parse_job_cards(html: Union[str, bytes], base_url: str, selectors: CardSelectors, source: str) -> List[Job]:
+    # base_url is the page's final URL; cards often carry relative hrefs
+    title_sel = selectors["title"]
+    company_sel = selectors["company"]
+    location_sel = selectors["location"]
+    link_sel = selectors["link"]
+    jobs: List[Job] = []
+    # encoding=True lets lexbor honour the page's declared charset for raw bytes
+    for card in LexborHTMLParser(html, encoding=True).css(selectors["cards"]):
+        title_elem = card.css_first(title_sel)
+        company_elem = card.css_first(company_sel)
+        location_elem = card.css_first(location_sel)
+        link_elem = card.css_first(link_sel) if link_sel else title_elem
+        if title_elem is None or company_elem is None or location_elem is None or link_elem is None:
+            continue
+        href = link_elem.attributes.get("href")
+        jobs.append({
+            "job_title": title_elem.text().strip(),
+            "company_name": company_elem.text().strip(),
+            "location": location_elem.text().strip(),
+            "source_link": urljoin(base_url, href) if href is not None else None,
+            "source": source
+        })
+    return jobs
+
+parse_linkedin = partial(parse_job_cards, selectors=LINKEDIN_SELECTORS, source="LinkedIn")
+parse_jobsdb = partial(parse_job_cards, selectors=JOBSDB_SELECTORS, source="JobsDB")
+parse_glassdoor = partial(parse_job_cards, selectors=GLASSDOOR_SELECTORS, source="Glassdoor")
@@ -17,8 +17,8 @@ Example log output (using the new logging function):
 2025-07-02 10:27:45,117 [INFO] LinkedIn: 25 jobs found before filtering.
 2025-07-02 10:27:45,117 [INFO] LinkedIn: 3 jobs matched all criteria.
 2025-07-02 10:27:45,117 [INFO] LinkedIn: 22 jobs rejected. Reasons:
-2025-07-02 10:27:45,117 [INFO]   - Job 'Backend Developer' rejected: location mismatch (expected 'Remote', got 'Onsite')
-2025-07-02 10:27:45,117 [INFO]   - Job 'Data Analyst' rejected: salary below minimum (expected >= 60000, got 50000)
+  - Job 'Backend Developer' rejected: location mismatch (expected 'Remote', got 'Onsite')
+  - Job 'Data Analyst' rejected: salary below minimum (expected >= 60000, got 50000)
 
 Note: Replace previous ad-hoc logging with these functions in your scraping and filtering code.
 
@@ -26,24 +26,28 @@ Example logging function definitions (place in your logging module):
 """
 
 def log_job_scrape_start(website):
-    logging.info(f"Scraping {website} for jobs...")
+    logging.info("Scraping %s for jobs...", website)
 
 def log_jobs_found(website, count):
-    logging.info(f"{website}: {count} jobs found before filtering.")
+    logging.info("%s: %d jobs found before filtering.", website, count)
 
 def log_jobs_matched(website, count):
-    logging.info(f"{website}: {count} jobs matched all criteria.")
+    logging.info("%s: %d jobs matched all criteria.", website, count)
 
 def log_jobs_rejected(website, rejected_jobs):
-    logging.info(f"{website}: {len(rejected_jobs)} jobs rejected. Reasons:")
+    # One record for the whole list; skip building it when INFO is disabled
+    if not logging.getLogger().isEnabledFor(logging.INFO):
+        return
+    lines = [f"{website}: {len(rejected_jobs)} jobs rejected. Reasons:"]
     for job in rejected_jobs:
         title = job.get("title", "Unknown")
-        for reason in job.get("reasons", []):
-            logging.info(f"  - Job '{title}' rejected: {reason}")
+        lines.extend(f"  - Job '{title}' rejected: {reason}" for reason in job.get("reasons", []))
+    logging.info("\n".join(lines))
 
 def log_job_rejection(website, job_title, reasons):
-    for reason in reasons:
-        logging.info(f"{website}: Job '{job_title}' rejected: {reason}")
+    if not logging.getLogger().isEnabledFor(logging.INFO):
+        return
+    logging.info("\n".join(f"{website}: Job '{job_title}' rejected: {reason}" for reason in reasons))
 
 """
 Automated Job Aggregator and Enrichment Bot
@@ -65,22 +69,34 @@ Note: This is a high-level scaffold. Each component should be implemented in its
 import os
 import sys
 import time
-import json
+import orjson
+import queue
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Awaitable, Callable, Iterable, Iterator, Optional, Tuple, Union
 
 # --- CONFIGURATION ---
 
 CONFIG_FILE = "config.json"
 LOG_FILE = "job_aggregator.log"
+SEEN_JOBS_FILE = "seen_jobs.pkl"
 
 # --- LOGGING SETUP ---
 
+# Callers only enqueue records; a background listener thread does the file I/O.
+_log_queue = queue.SimpleQueue()
+_log_file_handler = logging.FileHandler(LOG_FILE)
+_log_file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+_log_listener = QueueListener(_log_queue, _log_file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
-    filename=LOG_FILE,
     level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s"
+    format="%(message)s",  # timestamps are added by the file handler's formatter
+    handlers=[QueueHandler(_log_queue)]
 )
 
 # --- USER CONFIGURATION ---
@@ -93,26 +109,116 @@ def load_config(config_path: str = CONFIG_FILE) -> Dict[str, Any]:
             "location": "Remote",
             "salary_range": "60000-80000",
             "currency": "USD",
-            "schedule": None,  # e.g., "daily 08:00"
+            "max_pages": 3,
+            "render_js": [],  # e.g., ["glassdoor"] to fetch through headless Chrome
+            "distributed": False,  # run scrapers and enrichment on Celery workers
+            "schedule": None,  # e.g., "daily 08:00", "mon-fri 09:30", or a list of these
+            "google_sheet": {
+                "spreadsheet_id": None,
+                "credentials_file": "service_account.json",
+                "worksheet": "Jobs"
+            },
             "notification": {
                 "email": None,
                 "slack_webhook": None
             }
         }
-        with open(config_path, "w") as f:
-            json.dump(template, f, indent=2)
+        with open(config_path, "wb") as f:
+            f.write(orjson.dumps(template, option=orjson.OPT_INDENT_2))
         print(f"Config file created at {config_path}. Please edit it and re-run.")
         sys.exit(0)
-    with open(config_path, "r") as f:
-        return json.load(f)
+    with open(config_path, "rb") as f:
+        return orjson.loads(f.read())
 
-# --- SCRAPERS (STUBS) ---
+# --- SCRAPERS ---
 
+import threading
+from functools import partial
+import anyio
+import httpx
+from job_parsers import SITE_SELECTORS, parse_linkedin, parse_jobsdb, parse_glassdoor
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-import time
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+def new_client() -> httpx.AsyncClient:
+    # HTTP/2 multiplexes concurrent requests to one host over a single
+    # connection, so each site costs one TLS handshake per run.
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30),
+        timeout=httpx.Timeout(30.0),
+        headers=HTTP_HEADERS,
+        follow_redirects=True
+    )
+
+# One client per process, shared by scrapers and enrichment and created on
+# first use; close_client() closes it on the event loop that owns it.
+_client: Optional[httpx.AsyncClient] = None
+
+def get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = new_client()
+    return _client
+
+async def close_client():
+    # Must run on the event loop that used the client, so this is awaited at
+    # the end of main's async entry point rather than registered with atexit.
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+# Per-host concurrency caps: pages of one site are fetched in parallel up to
+# this limit while the other sites proceed independently.
+SITE_LIMITERS = {
+    "linkedin": anyio.CapacityLimiter(4),
+    "jobsdb": anyio.CapacityLimiter(4),
+    "glassdoor": anyio.CapacityLimiter(4),
+}
+
+async def run_all(jobs: List[Callable[[], Awaitable[Any]]], return_exceptions: bool = False) -> List[Any]:
+    # asyncio.gather-style results, but inside a task group so a failing job
+    # cancels and joins its siblings instead of leaving them running
+    results: List[Any] = [None] * len(jobs)
+
+    async def run(index: int, job: Callable[[], Awaitable[Any]]):
+        try:
+            results[index] = await job()
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            results[index] = e
+
+    async with anyio.create_task_group() as tg:
+        for index, job in enumerate(jobs):
+            tg.start_soon(run, index, job)
+    return results
+
+async def fetch_html(client: httpx.AsyncClient, url: str) -> Tuple[bytes, str]:
+    # Raw bytes go straight to selectolax, which detects the encoding itself;
+    # resp.text would decode (and possibly sniff the charset) in Python first.
+    # The final URL (after redirects) is returned to resolve relative links.
+    resp = await client.get(url)
+    resp.raise_for_status()
+    return resp.content, str(resp.url)
+
+# Sites listed in config["render_js"] need a real browser. Drivers are kept
+# per site for the life of the process since Chromium startup costs seconds.
+_driver_pool: Dict[str, webdriver.Chrome] = {}
+_driver_locks: Dict[str, threading.Lock] = {}
+_driver_pool_lock = threading.Lock()
+RENDER_TIMEOUT = 10
 
 def get_webdriver():
     chrome_options = Options()
@@ -122,193 +228,614 @@ def get_webdriver():
     driver = webdriver.Chrome(options=chrome_options)
     return driver
 
-def scrape_linkedin(config: Dict[str, Any]) -> List[Dict[str, Any]]:
-    logging.info("Scraping LinkedIn for jobs...")
+def get_or_create_driver(site: str) -> Tuple[webdriver.Chrome, threading.Lock]:
+    with _driver_pool_lock:
+        if site not in _driver_pool:
+            _driver_pool[site] = get_webdriver()
+            _driver_locks[site] = threading.Lock()
+        return _driver_pool[site], _driver_locks[site]
+
+def _quit_driver(driver: webdriver.Chrome):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+def discard_driver(site: str, driver: webdriver.Chrome):
+    # Drop a dead driver so the next render for this site starts a fresh one
+    with _driver_pool_lock:
+        if _driver_pool.get(site) is driver:
+            del _driver_pool[site]
+            del _driver_locks[site]
+    _quit_driver(driver)
+
+def close_driver_pool():
+    with _driver_pool_lock:
+        for driver in _driver_pool.values():
+            _quit_driver(driver)
+        _driver_pool.clear()
+        _driver_locks.clear()
+
+atexit.register(close_driver_pool)
+
+def render_html(site: str, url: str) -> Tuple[str, str]:
+    while True:
+        driver, lock = get_or_create_driver(site)
+        with lock:
+            # Threads queued on the lock of a driver that has since been
+            # discarded must pick up its replacement instead
+            with _driver_pool_lock:
+                if _driver_pool.get(site) is not driver:
+                    continue
+            discarded = False
+            try:
+                driver.get(url)
+                # Return as soon as the first job card is in the DOM
+                try:
+                    WebDriverWait(driver, RENDER_TIMEOUT).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, SITE_SELECTORS[site]["cards"]))
+                    )
+                except TimeoutException:
+                    logging.warning(f"{site}: no job cards rendered within {RENDER_TIMEOUT}s for {url}")
+                return driver.page_source, driver.current_url
+            except TimeoutException:
+                raise
+            except WebDriverException:
+                # Crashed Chrome or lost session; the driver is not reusable
+                discard_driver(site, driver)
+                discarded = True
+                raise
+            finally:
+                # Best effort, and skipped once the driver has been quit: a
+                # dead chromedriver fails with urllib3 errors after retries,
+                # which would replace the original exception
+                if not discarded:
+                    try:
+                        driver.delete_all_cookies()
+                    except Exception:
+                        pass
+
+async def fetch_page(client: httpx.AsyncClient, url: str, limiter: anyio.CapacityLimiter, site: Optional[str] = None) -> Tuple[Union[str, bytes], str]:
+    async with limiter:
+        if site:
+            return await anyio.to_thread.run_sync(render_html, site, url)
+        return await fetch_html(client, url)
+
+async def fetch_pages(client: httpx.AsyncClient, site: str, urls: List[str], config: Dict[str, Any]) -> List[Tuple[Union[str, bytes], str]]:
+    limiter = SITE_LIMITERS[site]
+    render_site = site if site in config.get("render_js", []) else None
+    results = await run_all(
+        [partial(fetch_page, client, url, limiter, render_site) for url in urls],
+        return_exceptions=True
+    )
+    pages = []
+    for url, result in zip(urls, results):
+        if isinstance(result, BaseException):
+            logging.error(f"{site}: failed to fetch {url}: {result}")
+            continue
+        pages.append(result)
+    return pages
+
+
+async def scrape_linkedin(client: httpx.AsyncClient, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    log_job_scrape_start("LinkedIn")
     jobs = []
-    driver = get_webdriver()
     try:
         keywords = "+".join(config.get("job_keywords", []))
         location = config.get("location", "Remote")
-        url = f"https://www.linkedin.com/jobs/search/?keywords={keywords}&location={location}&trk=public_jobs_jobs-search-bar_search-submit&position=1&pageNum=0"
-        driver.get(url)
-        time.sleep(3)
-        job_cards = driver.find_elements(By.CSS_SELECTOR, "ul.jobs-search__results-list li")
-        for card in job_cards:
-            try:
-                title_elem = card.find_element(By.CSS_SELECTOR, "h3")
-                company_elem = card.find_element(By.CSS_SELECTOR, "h4")
-                location_elem = card.find_element(By.CSS_SELECTOR, ".job-search-card__location")
-                link_elem = card.find_element(By.CSS_SELECTOR, "a")
-                job = {
-                    "job_title": title_elem.text.strip(),
-                    "company_name": company_elem.text.strip(),
-                    "location": location_elem.text.strip(),
-                    "source_link": link_elem.get_attribute("href"),
-                    "source": "LinkedIn"
-                }
-                jobs.append(job)
-            except NoSuchElementException:
-                continue
+        max_pages = config.get("max_pages", 1)
+        urls = [
+            f"https://www.linkedin.com/jobs/search/?keywords={keywords}&location={location}&trk=public_jobs_jobs-search-bar_search-submit&position=1&pageNum=0&start={page * 25}"
+            for page in range(max_pages)
+        ]
+        for html, page_url in await fetch_pages(client, "linkedin", urls, config):
+            jobs.extend(parse_linkedin(html, page_url))
     except Exception as e:
         logging.error(f"LinkedIn scraping error: {e}")
-    finally:
-        driver.quit()
-    logging.info(f"LinkedIn: {len(jobs)} jobs found before filtering.")
+    log_jobs_found("LinkedIn", len(jobs))
     return jobs
 
-def scrape_jobsdb(config: Dict[str, Any]) -> List[Dict[str, Any]]:
-    logging.info("Scraping JobsDB for jobs...")
+async def scrape_jobsdb(client: httpx.AsyncClient, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    log_job_scrape_start("JobsDB")
     jobs = []
-    driver = get_webdriver()
     try:
         keywords = "+".join(config.get("job_keywords", []))
         location = config.get("location", "")
-        url = f"https://www.jobsdb.com/en-hk/jobs/{keywords}/{location}"
-        driver.get(url)
-        time.sleep(3)
-        job_cards = driver.find_elements(By.CSS_SELECTOR, "div.sx2jih0.zcydq8h")
-        for card in job_cards:
-            try:
-                title_elem = card.find_element(By.CSS_SELECTOR, "a.sx2jih0.zcydq84.zcydq8h._17fduda0._17fduda7._17fduda7._17fduda7")
-                company_elem = card.find_element(By.CSS_SELECTOR, "span.sx2jih0.zcydq84.zcydq8h._17fduda0._17fduda7._17fduda7._17fduda7")
-                location_elem = card.find_element(By.CSS_SELECTOR, "span.sx2jih0.zcydq84.zcydq8h._17fduda0._17fduda7._17fduda7._17fduda7+span")
-                job = {
-                    "job_title": title_elem.text.strip(),
-                    "company_name": company_elem.text.strip(),
-                    "location": location_elem.text.strip(),
-                    "source_link": title_elem.get_attribute("href"),
-                    "source": "JobsDB"
-                }
-                jobs.append(job)
-            except NoSuchElementException:
-                continue
+        max_pages = config.get("max_pages", 1)
+        urls = [
+            f"https://www.jobsdb.com/en-hk/jobs/{keywords}/{location}?page={page}"
+            for page in range(1, max_pages + 1)
+        ]
+        for html, page_url in await fetch_pages(client, "jobsdb", urls, config):
+            jobs.extend(parse_jobsdb(html, page_url))
     except Exception as e:
         logging.error(f"JobsDB scraping error: {e}")
-    finally:
-        driver.quit()
-    logging.info(f"JobsDB: {len(jobs)} jobs found before filtering.")
+    log_jobs_found("JobsDB", len(jobs))
     return jobs
 
-def scrape_glassdoor(config: Dict[str, Any]) -> List[Dict[str, Any]]:
-    logging.info("Scraping Glassdoor for jobs...")
+async def scrape_glassdoor(client: httpx.AsyncClient, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    log_job_scrape_start("Glassdoor")
     jobs = []
-    driver = get_webdriver()
     try:
         keywords = "+".join(config.get("job_keywords", []))
         location = config.get("location", "")
-        url = f"https://www.glassdoor.com/Job/jobs.htm?sc.keyword={keywords}&locT=C&locId=&locKeyword={location}"
-        driver.get(url)
-        time.sleep(3)
-        job_cards = driver.find_elements(By.CSS_SELECTOR, "li.react-job-listing")
-        for card in job_cards:
-            try:
-                title_elem = card.find_element(By.CSS_SELECTOR, "a.jobLink span")
-                company_elem = card.find_element(By.CSS_SELECTOR, "div.jobHeader a")
-                location_elem = card.find_element(By.CSS_SELECTOR, "span.pr-xxsm")
-                link_elem = card.find_element(By.CSS_SELECTOR, "a.jobLink")
-                job = {
-                    "job_title": title_elem.text.strip(),
-                    "company_name": company_elem.text.strip(),
-                    "location": location_elem.text.strip(),
-                    "source_link": link_elem.get_attribute("href"),
-                    "source": "Glassdoor"
-                }
-                jobs.append(job)
-            except NoSuchElementException:
-                continue
+        max_pages = config.get("max_pages", 1)
+        urls = [
+            f"https://www.glassdoor.com/Job/jobs.htm?sc.keyword={keywords}&locT=C&locId=&locKeyword={location}&p={page}"
+            for page in range(1, max_pages + 1)
+        ]
+        for html, page_url in await fetch_pages(client, "glassdoor", urls, config):
+            jobs.extend(parse_glassdoor(html, page_url))
     except Exception as e:
         logging.error(f"Glassdoor scraping error: {e}")
-    finally:
-        driver.quit()
-    logging.info(f"Glassdoor: {len(jobs)} jobs found before filtering.")
+    log_jobs_found("Glassdoor", len(jobs))
     return jobs
 
 # --- ENRICHMENT (STUBS) ---
 
-def enrich_company_background(company_name: str) -> Dict[str, Any]:
-    # TODO: Integrate with Perplexity API
-    logging.info(f"Enriching company background for {company_name}...")
+import diskcache
+
+ENRICH_BATCH_SIZE = 50
+ENRICH_CACHE_DIR = "enrich.cache"
+ENRICH_CACHE_TTL = 7 * 24 * 3600
+
+_enrich_cache = None
+
+def get_enrich_cache() -> diskcache.Cache:
+    global _enrich_cache
+    if _enrich_cache is None:
+        _enrich_cache = diskcache.Cache(ENRICH_CACHE_DIR)
+    return _enrich_cache
+
+def _chunked(items: List[Any], size: int) -> List[List[Any]]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+async def _enrich_company_chunk(client: httpx.AsyncClient, company_names: List[str]) -> Dict[str, Dict[str, Any]]:
+    # TODO: Integrate with Perplexity API (one POST per chunk, e.g. {"companies": company_names})
+    logging.info(f"Enriching company background for {len(company_names)} companies...")
     return {
-        "industry": None,
-        "company_size": None,
-        "year_founded": None,
-        "notable_info": None
+        name: {
+            "industry": None,
+            "company_size": None,
+            "year_founded": None,
+            "notable_info": None
+        }
+        for name in company_names
     }
 
-def benchmark_salary(job_title: str, location: str) -> Dict[str, Any]:
-    # TODO: Integrate with Glassdoor or other salary APIs
-    logging.info(f"Benchmarking salary for {job_title} in {location}...")
+async def _cached_batch(client: httpx.AsyncClient, namespace: str, keys: List[Any], fetch_chunk) -> Dict[Any, Dict[str, Any]]:
+    # Serve repeat lookups from the on-disk cache; only misses reach the API
+    cache = get_enrich_cache()
+    results = {}
+    missing = []
+    for key in keys:
+        cached = cache.get((namespace, key))
+        if cached is None:
+            missing.append(key)
+        else:
+            results[key] = cached
+    fetched = await run_all(
+        [partial(fetch_chunk, client, chunk) for chunk in _chunked(missing, ENRICH_BATCH_SIZE)]
+    )
+    for chunk in fetched:
+        for key, info in chunk.items():
+            results[key] = info
+            # Empty lookups are not cached so they are retried next run
+            if any(value is not None for value in info.values()):
+                cache.set((namespace, key), info, expire=ENRICH_CACHE_TTL)
+    return results
+
+async def enrich_company_background_batch(client: httpx.AsyncClient, company_names: List[str]) -> Dict[str, Dict[str, Any]]:
+    return await _cached_batch(client, "company", company_names, _enrich_company_chunk)
+
+async def _benchmark_salary_chunk(client: httpx.AsyncClient, positions: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    # TODO: Integrate with Glassdoor or other salary APIs (one request per chunk)
+    logging.info(f"Benchmarking salary for {len(positions)} title/location pairs...")
     return {
-        "average_salary": None,
-        "comparison": None  # "above", "below", "within"
+        position: {
+            "average_salary": None,
+            "comparison": None  # "above", "below", "within"
+        }
+        for position in positions
     }
 
-# --- GOOGLE SHEETS INTEGRATION (STUB) ---
-
-def append_to_google_sheet(job_entries: List[Dict[str, Any]]):
-    # TODO: Implement Google Sheets API integration
-    logging.info(f"Appending {len(job_entries)} jobs to Google Sheet...")
-    pass
-
-def is_duplicate(job: Dict[str, Any], existing_jobs: List[Dict[str, Any]]) -> bool:
-    for existing in existing_jobs:
-        if (job["job_title"] == existing["job_title"] and
-            job["company_name"] == existing["company_name"] and
-            job["source_link"] == existing["source_link"]):
-            return True
-    return False
+async def benchmark_salary_batch(client: httpx.AsyncClient, positions: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    return await _cached_batch(client, "salary", positions, _benchmark_salary_chunk)
+
+# --- JOB TABLES ---
+
+import polars as pl
+
+# Jobs are held column-wise so dedupe and enrichment run as vectorized frame ops
+JOB_SCHEMA = {
+    "job_title": pl.Utf8,
+    "company_name": pl.Utf8,
+    "location": pl.Utf8,
+    "source_link": pl.Utf8,
+    "source": pl.Utf8
+}
+COMPANY_SCHEMA = {
+    "company_name": pl.Utf8,
+    "industry": pl.Utf8,
+    "company_size": pl.Utf8,
+    "year_founded": pl.Int64,
+    "notable_info": pl.Utf8
+}
+SALARY_SCHEMA = {
+    "job_title": pl.Utf8,
+    "location": pl.Utf8,
+    "average_salary": pl.Float64,
+    "comparison": pl.Utf8
+}
+DEDUPE_KEYS = ["job_title", "company_name", "source_link"]
+
+def jobs_frame(jobs: List[Dict[str, Any]]) -> pl.DataFrame:
+    return pl.DataFrame(jobs, schema=JOB_SCHEMA)
+
+# --- GOOGLE SHEETS INTEGRATION ---
+
+from google.oauth2.service_account import Credentials
+from googleapiclient.discovery import build
+from googleapiclient.model import JsonModel
+
+SHEETS_SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+SHEET_COLUMNS = [
+    "job_title", "company_name", "location", "source", "source_link",
+    "industry", "company_size", "year_founded", "notable_info",
+    "average_salary", "comparison", "scraped_at"
+]
+# Rows per API call; bounds both the request size and the rows held in memory
+SHEET_APPEND_CHUNK_ROWS = 500
+
+_sheets_service = None
+
+class OrjsonModel(JsonModel):
+    """JsonModel that serializes request bodies with orjson."""
+
+    def serialize(self, body_value):
+        return orjson.dumps(body_value)
+
+def get_sheets_service(credentials_file: str):
+    global _sheets_service
+    if _sheets_service is None:
+        credentials = Credentials.from_service_account_file(credentials_file, scopes=SHEETS_SCOPES)
+        _sheets_service = build("sheets", "v4", credentials=credentials, cache_discovery=False, model=OrjsonModel())
+    return _sheets_service
+
+def iter_sheet_rows(job_entries: pl.DataFrame) -> Iterator[Tuple[Any, ...]]:
+    # iter_rows converts the frame a buffer at a time, never all rows at once
+    return job_entries.select(SHEET_COLUMNS).iter_rows()
+
+def _append_rows(service, spreadsheet_id: str, worksheet: str, rows: List[Tuple[Any, ...]]):
+    service.spreadsheets().values().append(
+        spreadsheetId=spreadsheet_id,
+        range=f"{worksheet}!A:{chr(ord('A') + len(SHEET_COLUMNS) - 1)}",
+        valueInputOption="RAW",
+        insertDataOption="INSERT_ROWS",
+        body={"majorDimension": "ROWS", "values": rows}
+    ).execute()
+
+def sheet_configured(config: Dict[str, Any]) -> bool:
+    return bool((config.get("google_sheet") or {}).get("spreadsheet_id"))
+
+def append_to_google_sheet(
+    rows: Iterable[Tuple[Any, ...]],
+    config: Dict[str, Any],
+    chunk_size: int = SHEET_APPEND_CHUNK_ROWS,
+    on_appended: Optional[Callable[[List[Tuple[Any, ...]]], None]] = None
+) -> int:
+    # Returns the number of rows appended; on_appended sees each chunk right
+    # after it is stored, so callers can record progress before a later failure
+    if not sheet_configured(config):
+        logging.warning("No google_sheet.spreadsheet_id configured; skipping Google Sheet upload.")
+        return 0
+    sheet_config = config["google_sheet"]
+    spreadsheet_id = sheet_config["spreadsheet_id"]
+    service = get_sheets_service(sheet_config.get("credentials_file", "service_account.json"))
+    worksheet = sheet_config.get("worksheet", "Jobs")
+    # Flush a chunk per API call as rows arrive, so at most one chunk is held
+    buffer = []
+    appended = 0
+    for row in rows:
+        buffer.append(row)
+        if len(buffer) == chunk_size:
+            _append_rows(service, spreadsheet_id, worksheet, buffer)
+            appended += len(buffer)
+            if on_appended:
+                on_appended(buffer)
+            buffer.clear()
+    if buffer:
+        _append_rows(service, spreadsheet_id, worksheet, buffer)
+        appended += len(buffer)
+        if on_appended:
+            on_appended(buffer)
+    logging.info(f"Appended {appended} jobs to Google Sheet.")
+    return appended
+
+# --- DEDUPLICATION ---
+
+import pickle
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pybloom_live import ScalableBloomFilter
+from datasketch import MinHash, MinHashLSH
+
+NEAR_DUPLICATE_THRESHOLD = 0.85
+MINHASH_PERMUTATIONS = 64
+# The LSH index only covers recent postings: entries expire after this many
+# days and the oldest are evicted beyond the cap. The Bloom filter is the only
+# structure that grows with the full history.
+NEAR_DUPLICATE_WINDOW_DAYS = 30
+NEAR_DUPLICATE_MAX_ENTRIES = 20_000
+
+def _new_lsh() -> MinHashLSH:
+    return MinHashLSH(threshold=NEAR_DUPLICATE_THRESHOLD, num_perm=MINHASH_PERMUTATIONS)
+
+@dataclass
+class SeenJobs:
+    """Exact keys of every stored job plus a near-duplicate index of recent ones."""
+    keys: ScalableBloomFilter = field(
+        default_factory=lambda: ScalableBloomFilter(initial_capacity=1_000_000, error_rate=1e-3)
+    )
+    lsh: MinHashLSH = field(default_factory=_new_lsh)
+    # LSH key -> insertion time, oldest first
+    recent: "OrderedDict[str, float]" = field(default_factory=OrderedDict)
+
+def load_existing_jobs() -> List[Dict[str, Any]]:
+    # TODO: Load existing jobs from Google Sheet to check for duplicates
+    return []
+
+def job_key(job: Dict[str, Any]) -> str:
+    return f"{job['job_title']}|{job['company_name']}|{job['source_link']}"
+
+def job_minhash(job: Dict[str, Any]) -> MinHash:
+    # Character 3-grams tolerate small wording differences between boards;
+    # location is included so the same role in another city is kept
+    text = f"{job['job_title']} {job['company_name']} {job['location']}".lower()
+    minhash = MinHash(num_perm=MINHASH_PERMUTATIONS)
+    for i in range(max(len(text) - 2, 1)):
+        minhash.update(text[i:i + 3].encode("utf-8"))
+    return minhash
+
+def prune_seen_jobs(seen: SeenJobs, now: Optional[float] = None):
+    cutoff = (now or time.time()) - NEAR_DUPLICATE_WINDOW_DAYS * 24 * 3600
+    while seen.recent:
+        key, inserted_at = next(iter(seen.recent.items()))
+        if inserted_at >= cutoff and len(seen.recent) <= NEAR_DUPLICATE_MAX_ENTRIES:
+            break
+        seen.recent.popitem(last=False)
+        seen.lsh.remove(key)
+
+def remember_job(job: Dict[str, Any], seen: SeenJobs, minhash: Optional[MinHash] = None):
+    key = job_key(job)
+    seen.keys.add(key)
+    if key in seen.recent:
+        return
+    seen.lsh.insert(key, minhash or job_minhash(job))
+    seen.recent[key] = time.time()
+    if len(seen.recent) > NEAR_DUPLICATE_MAX_ENTRIES:
+        prune_seen_jobs(seen)
+
+def load_seen_jobs(path: str = SEEN_JOBS_FILE) -> SeenJobs:
+    # The index is persisted between runs so the sheet only has to be read once
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        if isinstance(state, tuple):
+            # Older files pickled (Bloom filter, unbounded LSH); keep the exact keys
+            seen = SeenJobs(keys=state[0])
+        else:
+            seen = SeenJobs(**state)
+        prune_seen_jobs(seen)
+        return seen
+    seen = SeenJobs()
+    for existing in load_existing_jobs():
+        if job_key(existing) not in seen.keys:
+            remember_job(existing, seen)
+    return seen
+
+def save_seen_jobs(seen: SeenJobs, path: str = SEEN_JOBS_FILE):
+    # Stored as a plain dict so the file loads whether main runs as __main__
+    # or is imported by a Celery worker
+    with open(path, "wb") as f:
+        pickle.dump({"keys": seen.keys, "lsh": seen.lsh, "recent": seen.recent}, f)
+
+def filter_new_jobs(jobs: pl.DataFrame, seen: SeenJobs) -> pl.DataFrame:
+    # Only reads the persisted state; jobs are remembered once they are stored.
+    # Repeats within this batch are caught by a batch-local index.
+    batch_keys = set()
+    batch_lsh = _new_lsh()
+    keep = []
+    for job in jobs.iter_rows(named=True):
+        key = job_key(job)
+        # Exact repeats are caught by the Bloom filter before hashing
+        if key in seen.keys or key in batch_keys:
+            keep.append(False)
+            continue
+        minhash = job_minhash(job)
+        if seen.lsh.query(minhash) or batch_lsh.query(minhash):
+            keep.append(False)
+            continue
+        batch_keys.add(key)
+        batch_lsh.insert(key, minhash)
+        keep.append(True)
+    return jobs.filter(pl.Series(keep, dtype=pl.Boolean))
 
 # --- MAIN BOT LOGIC ---
 
-def aggregate_jobs(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+async def aggregate_jobs(client: httpx.AsyncClient, config: Dict[str, Any]) -> pl.DataFrame:
+    scrapers = [scrape_linkedin, scrape_jobsdb, scrape_glassdoor]
+    results = await run_all(
+        [partial(scraper, client, config) for scraper in scrapers],
+        return_exceptions=True
+    )
     all_jobs = []
-    for scraper in [scrape_linkedin, scrape_jobsdb, scrape_glassdoor]:
-        try:
-            jobs = scraper(config)
-            all_jobs.extend(jobs)
-        except Exception as e:
-            logging.error(f"Error scraping: {scraper.__name__}: {e}")
+    for scraper, result in zip(scrapers, results):
+        if isinstance(result, BaseException):
+            logging.error(f"Error scraping: {scraper.__name__}: {result}")
+            continue
+        all_jobs.extend(result)
     logging.info(f"Total jobs scraped: {len(all_jobs)}")
-    return all_jobs
-
-def enrich_and_store_jobs(jobs: List[Dict[str, Any]], config: Dict[str, Any]):
-    enriched_jobs = []
-    # TODO: Load existing jobs from Google Sheet to check for duplicates
-    existing_jobs = []  # Placeholder
-    for job in jobs:
-        if is_duplicate(job, existing_jobs):
+    return jobs_frame(all_jobs)
+
+async def enrich_and_store_jobs(client: httpx.AsyncClient, jobs: pl.DataFrame, config: Dict[str, Any]):
+    if not sheet_configured(config):
+        # Nothing can be stored, so leave the dedupe state untouched; these
+        # jobs must still count as new once the sheet is configured
+        logging.warning(f"No google_sheet.spreadsheet_id configured; {jobs.height} scraped jobs were not stored.")
+        return
+    # One timestamp for the whole batch
+    batch_ts = datetime.utcnow().isoformat()
+    seen = load_seen_jobs()
+    new_jobs = filter_new_jobs(jobs.unique(subset=DEDUPE_KEYS, maintain_order=True), seen)
+    # Enrich each unique company and title/location pair once, in batches
+    company_names = new_jobs.get_column("company_name").unique(maintain_order=True).to_list()
+    positions = new_jobs.select("job_title", "location").unique(maintain_order=True).rows()
+    company_info, salary_info = await run_all([
+        partial(enrich_company_background_batch, client, company_names),
+        partial(benchmark_salary_batch, client, positions)
+    ])
+    company_df = pl.DataFrame(
+        [{"company_name": name, **info} for name, info in company_info.items()],
+        schema=COMPANY_SCHEMA
+    )
+    salary_df = pl.DataFrame(
+        [{"job_title": title, "location": location, **info} for (title, location), info in salary_info.items()],
+        schema=SALARY_SCHEMA
+    )
+    enriched_jobs = (
+        new_jobs
+        .join(company_df, on="company_name", how="left")
+        .join(salary_df, on=["job_title", "location"], how="left")
+        .with_columns(pl.lit(batch_ts).alias("scraped_at"))
+    )
+
+    def remember_stored(rows: List[Tuple[Any, ...]]):
+        for row in rows:
+            remember_job(dict(zip(SHEET_COLUMNS, row)), seen)
+
+    # Save whatever was stored even if a later chunk fails, so a retry does
+    # not append the same rows again
+    try:
+        stored = await anyio.to_thread.run_sync(
+            append_to_google_sheet, iter_sheet_rows(enriched_jobs), config, SHEET_APPEND_CHUNK_ROWS, remember_stored
+        )
+    finally:
+        save_seen_jobs(seen)
+    logging.info(f"Enriched and stored {stored} new jobs.")
+
+# --- DISTRIBUTED RUNS (CELERY) ---
+#
+# With "distributed": true in the config, each scraper runs as a Celery task on
+# its own queue and enrichment runs on the "enrichment" queue. Start workers with:
+#   celery -A main worker -Q linkedin,jobsdb,glassdoor -c 4
+#   celery -A main worker -Q enrichment -c 1   # single writer for seen_jobs.pkl
+
+from celery import Celery, group
+
+CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL", "redis://localhost:6379/0")
+CELERY_RESULT_BACKEND = os.environ.get("CELERY_RESULT_BACKEND", "redis://localhost:6379/1")
+CELERY_TIMEOUT = 120
+
+celery_app = Celery("jobbot", broker=CELERY_BROKER_URL, backend=CELERY_RESULT_BACKEND)
+
+def _run_with_client(coro_fn, *args):
+    # Each task runs its own event loop, so it gets a client of its own
+    # instead of the process-wide one
+    async def run():
+        async with new_client() as client:
+            return await coro_fn(client, *args)
+    return anyio.run(run)
+
+@celery_app.task(name="jobbot.scrape_linkedin", queue="linkedin")
+def scrape_linkedin_task(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return _run_with_client(scrape_linkedin, config)
+
+@celery_app.task(name="jobbot.scrape_jobsdb", queue="jobsdb")
+def scrape_jobsdb_task(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return _run_with_client(scrape_jobsdb, config)
+
+@celery_app.task(name="jobbot.scrape_glassdoor", queue="glassdoor")
+def scrape_glassdoor_task(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return _run_with_client(scrape_glassdoor, config)
+
+@celery_app.task(name="jobbot.enrich_and_store", queue="enrichment")
+def enrich_and_store_task(jobs: List[Dict[str, Any]], config: Dict[str, Any]):
+    _run_with_client(enrich_and_store_jobs, jobs_frame(jobs), config)
+
+def aggregate_jobs_distributed(config: Dict[str, Any]) -> pl.DataFrame:
+    tasks = group(task.s(config) for task in (scrape_linkedin_task, scrape_jobsdb_task, scrape_glassdoor_task))
+    results = tasks().get(timeout=CELERY_TIMEOUT, propagate=False)
+    all_jobs = []
+    for result in results:
+        if isinstance(result, BaseException):
+            logging.error(f"Error scraping: {result}")
             continue
-        # Enrich company background
-        company_info = enrich_company_background(job.get("company_name", ""))
-        job.update(company_info)
-        # Salary benchmarking
-        salary_info = benchmark_salary(job.get("job_title", ""), job.get("location", ""))
-        job.update(salary_info)
-        # Add timestamp
-        job["scraped_at"] = datetime.utcnow().isoformat()
-        enriched_jobs.append(job)
-    append_to_google_sheet(enriched_jobs)
-    logging.info(f"Enriched and stored {len(enriched_jobs)} new jobs.")
-
-# --- SCHEDULING (SIMPLE LOOP) ---
-
-def run_bot(config: Dict[str, Any]):
+        all_jobs.extend(result)
+    logging.info(f"Total jobs scraped: {len(all_jobs)}")
+    return jobs_frame(all_jobs)
+
+def run_distributed(config: Dict[str, Any]):
+    jobs = aggregate_jobs_distributed(config)
+    enrich_and_store_task.delay(jobs.to_dicts(), config).get(timeout=CELERY_TIMEOUT)
+
+# --- SCHEDULING ---
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+
+async def run_bot(config: Dict[str, Any]):
     logging.info("Job Aggregator Bot started.")
-    jobs = aggregate_jobs(config)
-    enrich_and_store_jobs(jobs, config)
+    if config.get("distributed"):
+        await anyio.to_thread.run_sync(run_distributed, config)
+    else:
+        client = get_client()
+        jobs = await aggregate_jobs(client, config)
+        await enrich_and_store_jobs(client, jobs, config)
     logging.info("Job Aggregator Bot finished.")
 
+async def run_bot_once(config: Dict[str, Any]):
+    try:
+        await run_bot(config)
+    finally:
+        await close_client()
+
+def parse_schedule(schedule: str) -> CronTrigger:
+    # "daily 08:00", or a cron day-of-week spec such as "mon-fri 08:00"
+    days, _, time_of_day = schedule.strip().partition(" ")
+    try:
+        hour, minute = (int(part) for part in time_of_day.split(":"))
+        day_of_week = "*" if days.lower() == "daily" else days.lower()
+        return CronTrigger(day_of_week=day_of_week, hour=hour, minute=minute)
+    except ValueError as e:
+        raise ValueError(f"Invalid schedule {schedule!r}: expected e.g. 'daily 08:00'") from e
+
+async def run_scheduled(config: Dict[str, Any], triggers: List[CronTrigger]):
+    # Runs share this event loop and therefore the process-wide HTTP client,
+    # which is closed here on the same loop
+    scheduler = AsyncIOScheduler()
+    for trigger in triggers:
+        scheduler.add_job(run_bot, trigger, args=[config], max_instances=1, coalesce=True)
+    scheduler.start()
+    try:
+        await anyio.sleep_forever()
+    finally:
+        scheduler.shutdown(wait=False)
+        await close_client()
+
 def main():
     config = load_config()
-    if config.get("schedule"):
-        # Simple scheduling: run at specified time daily
-        import schedule
-        schedule_time = config["schedule"]  # e.g., "daily 08:00"
-        # TODO: Parse schedule_time and set up schedule
-        print("Scheduling not fully implemented. Running once for now.")
-        run_bot(config)
+    schedules = config.get("schedule")
+    if schedules:
+        if isinstance(schedules, str):
+            schedules = [schedules]
+        # Parse once at startup; invalid entries fail before anything is scheduled
+        triggers = [parse_schedule(schedule) for schedule in schedules]
+        logging.info(f"Scheduling runs: {', '.join(schedules)}")
+        print(f"Scheduled runs: {', '.join(schedules)}. Press Ctrl+C to stop.")
+        anyio.run(run_scheduled, config, triggers)
     else:
-        run_bot(config)
+        anyio.run(run_bot_once, config)
 
 if __name__ == "__main__":
     main()